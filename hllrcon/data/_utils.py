@@ -59,12 +59,10 @@ class IndexedBaseModel(BaseModel, Generic[H, R]):
 
     @classmethod
     def _lookup_register(cls, id_: H, instance: Self) -> None:
-        if id_ in cls._lookup_map:
+        if cls._lookup_map.setdefault(id_, instance) is not instance:
             msg = f"{cls.__name__} with ID {id_} already exists."
             raise ValueError(msg)
 
-        cls._lookup_map[id_] = instance
-
     @classmethod
     def _lookup_fallback(cls, id_: H) -> Self | R:
         msg = f"{cls.__name__} with ID {id_} not found."
@@ -2,6 +2,7 @@
 # ruff: noqa: N802
 
 import re
+from collections.abc import Iterable
 from enum import StrEnum
 from functools import cached_property
 from typing import Annotated, Self
@@ -43,9 +44,15 @@ from hllrcon.data.sectors import (
     SECTORS_TOBRUK_LARGE,
     SECTORS_TOBRUK_SMALL,
     SECTORS_UTAHBEACH_LARGE,
+    CaptureZone,
     Grid,
+    GridPos,
     Sector,
     Strongpoint,
+    StrongpointTableRow,
+    WorldPos2D,
+    WorldPos3D,
+    _find_in_strongpoint_table,
 )
 
 from ._utils import (
@@ -173,10 +180,10 @@ class Layer(CaseInsensitiveIndexedBaseModel):
     def _set_sectors_layer_backref(self) -> Self:
         # TODO: Deepcopy. More difficult than it looks because the models are frozen :(
         for sector in self.sectors:
-            sector._layer = self  # type: ignore[misc] # noqa: SLF001
+            sector._attach_layer(self)  # noqa: SLF001
 
             for capture_zone in sector.capture_zones:
-                capture_zone._layer = self  # type: ignore[misc] # noqa: SLF001
+                capture_zone._attach_layer(self)  # noqa: SLF001
 
         return self
 
@@ -184,16 +191,7 @@ class Layer(CaseInsensitiveIndexedBaseModel):
     def _apply_offset_to_strongpoints(self) -> Self:
         for sector in self.sectors:
             for capture_zone in sector.capture_zones:
-                # Bit of a hack to get around the model being frozen
-                object.__setattr__(
-                    capture_zone.strongpoint,
-                    "center",
-                    (
-                        capture_zone.strongpoint.center[0] + self.grid.offset[0],
-                        capture_zone.strongpoint.center[1] + self.grid.offset[1],
-                        capture_zone.strongpoint.center[2],
-                    ),
-                )
+                capture_zone.strongpoint._move(self.grid.offset)  # noqa: SLF001
         return self
 
     def __str__(self) -> str:
@@ -358,6 +356,105 @@ class Layer(CaseInsensitiveIndexedBaseModel):
 
             return cls._parse_id(id_)
 
+    def find_capture_zone(self, pos: WorldPos2D | WorldPos3D) -> CaptureZone | None:
+        """Find the capture zone whose strongpoint contains a given position.
+
+        Parameters
+        ----------
+        pos : tuple[float, float] | tuple[float, float, float]
+            The position to look up. If only two coordinates are given, the height of
+            the position is ignored.
+
+        Returns
+        -------
+        CaptureZone | None
+            The capture zone whose strongpoint contains the position, or `None` if the
+            position is not inside any strongpoint on this layer.
+
+        """
+        cell = self.grid.world_to_grid((pos[0], pos[1]))
+        return _find_in_strongpoint_table(
+            self._capture_zone_index.get(cell, ()),
+            pos,
+        )
+
+    def find_capture_zones(
+        self,
+        positions: Iterable[WorldPos2D | WorldPos3D],
+    ) -> list[CaptureZone | None]:
+        """Find the capture zones whose strongpoints contain each given position.
+
+        This is equivalent to calling `find_capture_zone` for each position, but avoids
+        the overhead of doing so when looking up many positions at once, such as the
+        positions of all players on the server.
+
+        Parameters
+        ----------
+        positions : Iterable[tuple[float, float] | tuple[float, float, float]]
+            The positions to look up. For positions with only two coordinates, the
+            height is ignored.
+
+        Returns
+        -------
+        list[CaptureZone | None]
+            For each position, the capture zone whose strongpoint contains it, or
+            `None` if it is not inside any strongpoint on this layer.
+
+        """
+        index = self._capture_zone_index
+        world_to_grid = self.grid.world_to_grid
+        return [
+            _find_in_strongpoint_table(
+                index.get(world_to_grid((pos[0], pos[1])), ()),
+                pos,
+            )
+            for pos in positions
+        ]
+
+    @property
+    def _capture_zone_index(self) -> dict[GridPos, tuple[StrongpointTableRow, ...]]:
+        # Buckets each strongpoint into every grid cell its bounding box overlaps, so
+        # that a lookup only has to test the handful of strongpoints near a position
+        # rather than every strongpoint on the layer. Rows keep their sector order
+        # within each cell, so results match a plain scan over all sectors.
+        #
+        # The index is rebuilt when the grid or the sectors are replaced, or when any
+        # strongpoint was moved since, as another layer may have moved strongpoints that
+        # this layer shares with it.
+        grid = self.grid
+        sectors = self.sectors
+        generation = Strongpoint._move_generation  # noqa: SLF001
+        cache: (
+            tuple[
+                Grid,
+                list[Sector],
+                int,
+                dict[GridPos, tuple[StrongpointTableRow, ...]],
+            ]
+            | None
+        ) = self.__dict__.get("_capture_zone_index")
+        if (
+            cache is not None
+            and cache[0] is grid
+            and cache[1] is sectors
+            and cache[2] == generation
+        ):
+            return cache[3]
+
+        index: dict[GridPos, list[StrongpointTableRow]] = {}
+        for sector in sectors:
+            for row in sector._strongpoint_table:  # noqa: SLF001
+                cx, cy, _, _, capture_zone = row
+                radius = abs(capture_zone.strongpoint.radius)
+                min_x, min_y = grid.world_to_grid((cx - radius, cy - radius))
+                max_x, max_y = grid.world_to_grid((cx + radius, cy + radius))
+                for x in range(min_x, max_x + 1):
+                    for y in range(min_y, max_y + 1):
+                        index.setdefault((x, y), []).append(row)
+        result = {cell: tuple(rows) for cell, rows in index.items()}
+        self.__dict__["_capture_zone_index"] = (grid, sectors, generation, result)
+        return result
+
     @computed_field
     @cached_property
     def pretty_name(self) -> str:
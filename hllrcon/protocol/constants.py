@@ -1,6 +1,9 @@
+import struct
 from typing import Final
 
 REQUEST_HEADER_FORMAT: Final[str] = "<III"
 RESPONSE_HEADER_FORMAT: Final[str] = "<III"
+REQUEST_HEADER_STRUCT: Final[struct.Struct] = struct.Struct(REQUEST_HEADER_FORMAT)
+RESPONSE_HEADER_STRUCT: Final[struct.Struct] = struct.Struct(RESPONSE_HEADER_FORMAT)
 MAGIC_HEADER_VALUE: Final[int] = 0xDE450508
 MAGIC_HEADER_BYTES: Final[bytes] = MAGIC_HEADER_VALUE.to_bytes(4, "little")
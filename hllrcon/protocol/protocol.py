@@ -1,9 +1,7 @@
-import array
 import asyncio
 import base64
 import itertools
 import logging
-import struct
 from collections.abc import Callable
 from typing import Any, Self
 
@@ -20,7 +18,7 @@ from hllrcon.exceptions import (
 from hllrcon.protocol.constants import (
     MAGIC_HEADER_BYTES,
     MAGIC_HEADER_VALUE,
-    RESPONSE_HEADER_FORMAT,
+    RESPONSE_HEADER_STRUCT,
 )
 from hllrcon.protocol.request import RconRequest
 from hllrcon.protocol.response import RconResponse
@@ -79,7 +77,7 @@ class RconProtocol(asyncio.Protocol):
 
         """
         self._transport: asyncio.Transport | None = None
-        self._buffer: bytes = b""
+        self._buffer = bytearray()
 
         self._waiters: dict[int, asyncio.Future[RconResponse]] = {}
 
@@ -202,55 +200,65 @@ class RconProtocol(asyncio.Protocol):
 
     @override
     def data_received(self, data: bytes) -> None:
-        self.logger.debug("Incoming: (%s) %s", self._xor(data).count(b"\t"), data[:10])
+        # Decoding the data just to log it is costly, so only do so when it gets logged
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Incoming: (%s) %s",
+                self._xor(data).count(b"\t"),
+                data[:10],
+            )
 
-        self._buffer += data
+        self._buffer.extend(data)
         self._read_from_buffer()
 
     def _read_from_buffer(self) -> None:
         pkt_id: int
         pkt_len: int
 
-        # Read header
-        header_len = struct.calcsize(RESPONSE_HEADER_FORMAT)
-        if len(self._buffer) < header_len:
-            self.logger.debug(
-                "Buffer too small (%s < %s)",
-                len(self._buffer),
-                header_len,
-            )
-            return
+        header_len = RESPONSE_HEADER_STRUCT.size
 
-        magic_idx = self._buffer.find(MAGIC_HEADER_BYTES)
-        if magic_idx > 0:
-            self.logger.warning(
-                "Magic header not at start of buffer, skipping %s bytes",
-                magic_idx,
-            )
-            self._buffer = self._buffer[magic_idx:]
-        elif magic_idx == -1:
-            self.logger.warning(
-                "Magic header not found in buffer, discarding %s bytes",
-                len(self._buffer),
-            )
-            self._buffer = b""
-            return
+        # Keep reading packets for as long as complete ones are on the buffer
+        while True:
+            # Read header
+            if len(self._buffer) < header_len:
+                self.logger.debug(
+                    "Buffer too small (%s < %s)",
+                    len(self._buffer),
+                    header_len,
+                )
+                return
 
-        magic, pkt_id, pkt_len = struct.unpack(
-            RESPONSE_HEADER_FORMAT,
-            self._buffer[:header_len],
-        )
-        assert magic == MAGIC_HEADER_VALUE  # noqa: S101
-        pkt_size = header_len + pkt_len
-        self.logger.debug("pkt_id = %s, pkt_len = %s", pkt_id, pkt_len)
+            magic_idx = self._buffer.find(MAGIC_HEADER_BYTES)
+            if magic_idx > 0:
+                self.logger.warning(
+                    "Magic header not at start of buffer, skipping %s bytes",
+                    magic_idx,
+                )
+                del self._buffer[:magic_idx]
+            elif magic_idx == -1:
+                self.logger.warning(
+                    "Magic header not found in buffer, discarding %s bytes",
+                    len(self._buffer),
+                )
+                self._buffer.clear()
+                return
+
+            magic, pkt_id, pkt_len = RESPONSE_HEADER_STRUCT.unpack_from(self._buffer)
+            assert magic == MAGIC_HEADER_VALUE  # noqa: S101
+            pkt_size = header_len + pkt_len
+            self.logger.debug("pkt_id = %s, pkt_len = %s", pkt_id, pkt_len)
+
+            # Check whether whole packet is on buffer
+            if len(self._buffer) < pkt_size:
+                return
 
-        # Check whether whole packet is on buffer
-        if len(self._buffer) >= pkt_size:
             # Read packet data from buffer
-            decoded_body = self._xor(self._buffer[header_len:pkt_size])
+            with memoryview(self._buffer) as view:
+                body = bytes(view[header_len:pkt_size])
+            decoded_body = self._xor(body)
             self.logger.debug("Unpacking: %s", decoded_body)
             pkt = RconResponse.unpack(pkt_id, decoded_body)
-            self._buffer = self._buffer[pkt_size:]
+            del self._buffer[:pkt_size]
 
             # Respond to waiter
             waiter = self._waiters.pop(pkt_id, None)
@@ -263,9 +271,9 @@ class RconProtocol(asyncio.Protocol):
             else:
                 waiter.set_result(pkt)
 
-            # Repeat if buffer is not empty; Another complete packet might be on it
-            if self._buffer:
-                self._read_from_buffer()
+            # Stop if buffer is empty; Otherwise another complete packet might be on it
+            if not self._buffer:
+                return
 
     @override
     def connection_lost(self, exc: Exception | None) -> None:
@@ -307,25 +315,18 @@ class RconProtocol(asyncio.Protocol):
             The encrypted or decrypted message.
 
         """
-        if not self.xorkey:
+        key = self.xorkey
+        if not key:
             return message
 
-        n = [
-            c ^ self.xorkey[(i + offset) % len(self.xorkey)]
-            for i, c in enumerate(message)
-        ]
-
-        res = array.array("B", n).tobytes()
-        if len(res) != len(message):
-            self.logger.warning(
-                "XOR operation resulted in a different length: %s != %s",
-                len(res),
-                len(message),
-            )
-            msg = "XOR operation resulted in a different length"
-            raise ValueError(msg)
-
-        return res
+        size = len(message)
+        start = offset % len(key)
+        # Repeat the key to cover the whole message at the given offset
+        key = (key * (size // len(key) + 2))[start : start + size]
+        # XOR the message and key as two large integers, which happens in C in one go
+        # rather than byte by byte.
+        res = int.from_bytes(message, "little") ^ int.from_bytes(key, "little")
+        return res.to_bytes(size, "little")
 
     async def execute(
         self,
@@ -374,7 +375,8 @@ class RconProtocol(asyncio.Protocol):
         # Send request
         header, body = request.pack()
         message = header + self._xor(body)
-        self.logger.debug("Writing: %s", header + body)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Writing: %s", header + body)
         self._transport.write(message)
 
         waiter: asyncio.Future[RconResponse] = self.loop.create_future()
@@ -1,9 +1,12 @@
 import itertools
 import json
-import struct
 from typing import Any, ClassVar
 
-from hllrcon.protocol.constants import MAGIC_HEADER_VALUE, REQUEST_HEADER_FORMAT
+from hllrcon.protocol.constants import MAGIC_HEADER_VALUE, REQUEST_HEADER_STRUCT
+
+# `json.dumps` builds a new encoder on every call when given custom separators, so one
+# is created up front and shared by all requests instead.
+_json_encode = json.JSONEncoder(separators=(",", ":")).encode
 
 
 class RconRequest:
@@ -55,12 +58,11 @@ class RconRequest:
             "contentBody": (
                 self.content_body
                 if isinstance(self.content_body, str)
-                else json.dumps(self.content_body, separators=(",", ":"))
+                else _json_encode(self.content_body)
             ),
         }
-        body_encoded = json.dumps(body, separators=(",", ":")).encode()
-        header = struct.pack(
-            REQUEST_HEADER_FORMAT,
+        body_encoded = _json_encode(body).encode()
+        header = REQUEST_HEADER_STRUCT.pack(
             MAGIC_HEADER_VALUE,
             self.request_id,
             len(body_encoded),
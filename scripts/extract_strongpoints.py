@@ -50,8 +50,10 @@ def main() -> None:
     else:
         strongpoints.sort(key=sort_key_vertical)
 
+    # Print the coordinate columns of each row in `hllrcon/data/sectors.csv`
     for strongpoint in strongpoints:
-        print(f", center={strongpoint.center}, radius={strongpoint.radius}")
+        x, y, z = strongpoint.center
+        print(f",{x},{y},{z},{strongpoint.radius}")
 
 
 if __name__ == "__main__":
@@ -12,13 +12,16 @@ from hllrcon.data import (
     Loadout,
     LoadoutId,
     Map,
+    Orientation,
     Role,
+    Sector,
     Strongpoint,
     Team,
     TimeOfDay,
     Vehicle,
     Weapon,
     Weather,
+    sectors,
 )
 from hllrcon.data._utils import (
     IndexedBaseModel,
@@ -487,6 +490,31 @@ class TestSectors:
         assert not sp.is_inside((-1, 0, 0))
         assert not sp.is_inside((10, 10, 10))
 
+    def test_strongpoint_is_inside_2d(self) -> None:
+        sp = Strongpoint(
+            id="FOO",
+            name="Foo",
+            center=(10, 0, 0),
+            radius=10,
+        )
+
+        assert sp.is_inside((10, 10))
+        assert sp.is_inside((17, 7))
+        assert not sp.is_inside((-1, 0))
+        assert not sp.is_inside((20, 10))
+
+    def test_strongpoint_is_inside_many(self) -> None:
+        sp = Strongpoint(
+            id="FOO",
+            name="Foo",
+            center=(10, 0, 0),
+            radius=10,
+        )
+        positions = [(10, 0, 0), (10, 10, 10), (10, 10), (20, 10), (-1, 0)]
+
+        assert sp.is_inside_many(positions) == [sp.is_inside(p) for p in positions]
+        assert sp.is_inside_many([]) == []
+
     def test_capture_zone_is_inside(self) -> None:
         zone = Layer.STMEREEGLISE_WARFARE_DAY.sectors[2].capture_zones[2]
 
@@ -499,6 +527,28 @@ class TestSectors:
         assert not zone.is_inside((0, 0))
         assert not zone.is_inside((-21000, 40000))
 
+    def test_capture_zone_contains(self) -> None:
+        layout = Sector.skirmish_layout(
+            Orientation.HORIZONTAL,
+            Strongpoint(id="FOO", name="Foo", center=(0, 0, 0), radius=20000),
+        )
+        Layer(
+            id="test_layer",
+            map=Map.CARENTAN,
+            game_mode=GameMode.SKIRMISH,
+            time_of_day=TimeOfDay.DAY,
+            weather=Weather.CLEAR,
+            grid=Grid.small(),
+            sectors=layout,
+        )
+        zone = layout[1].capture_zones[0]
+
+        assert zone.contains((0, 0))
+        assert zone.contains((10000, 10000, 0))
+        assert not zone.contains((10000, 10000, 15000))
+        assert not zone.contains((15000, 0))
+        assert zone.strongpoint.is_inside((15000, 0))
+
     def test_sector_is_inside(self) -> None:
         sector = Layer.KHARKOV_WARFARE_DAY.sectors[2]
 
@@ -508,6 +558,283 @@ class TestSectors:
         assert sector.is_inside((59000, 19000))
         assert not sector.is_inside((61000, 19000))
 
+    def test_sector_area(self) -> None:
+        sector = Layer.KHARKOV_WARFARE_DAY.sectors[2]
+
+        assert sector.from_ == (-59520.0, -19840.0)
+        assert sector.to == (59520.0, 19840.0)
+        assert sector.area == (sector.from_, sector.to)
+
+    def test_sector_area_after_copy(self) -> None:
+        sector = Layer.CARENTAN_WARFARE.sectors[2]
+        assert sector.from_ == (-20160.0, -60480.0)
+        assert not sector.is_inside((-90000, -90000))
+
+        copy = sector.model_copy(update={"grid_from": (-5, -5)})
+        assert copy.from_ == (-100800.0, -100800.0)
+        assert copy.to == sector.to
+        assert copy.is_inside((-90000, -90000))
+        assert sector.from_ == (-20160.0, -60480.0)
+
+    def test_sector_large_layout_from_flat(self) -> None:
+        strongpoints = [
+            capture_zone.strongpoint
+            for sector in sectors.SECTORS_TOBRUK_LARGE
+            for capture_zone in sector.capture_zones
+        ]
+        grouped = (
+            (strongpoints[0], strongpoints[1], strongpoints[2]),
+            (strongpoints[3], strongpoints[4], strongpoints[5]),
+            (strongpoints[6], strongpoints[7], strongpoints[8]),
+            (strongpoints[9], strongpoints[10], strongpoints[11]),
+            (strongpoints[12], strongpoints[13], strongpoints[14]),
+        )
+
+        assert Sector.large_layout_from_flat(
+            Orientation.HORIZONTAL,
+            strongpoints,
+        ) == Sector.large_layout(Orientation.HORIZONTAL, grouped)
+
+        with pytest.raises(ValueError, match=r"Expected 15 strongpoints, got 14"):
+            Sector.large_layout_from_flat(Orientation.HORIZONTAL, strongpoints[:-1])
+
+    def test_sector_find_capture_zone(self) -> None:
+        sector = Layer.CARENTAN_WARFARE.sectors[2]
+        town_center = sector.capture_zones[1]
+
+        assert sector.find_capture_zone(town_center.strongpoint.center) is town_center
+        assert sector.find_capture_zone((1021.0, 3900.0, 104.0)) is town_center
+        assert sector.find_capture_zone((1021.0, 4100.0, 104.0)) is None
+        assert sector.find_capture_zone((0.0, 99999.0, 0.0)) is None
+
+    def test_sector_find_capture_zone_after_offset(self) -> None:
+        layout = Sector.skirmish_layout(
+            Orientation.HORIZONTAL,
+            Strongpoint(id="FOO", name="Foo", center=(0, 0, 0), radius=100),
+        )
+        sector = layout[1]
+        assert sector.find_capture_zone((0, 0)) is not None
+
+        Layer(
+            id="test_layer",
+            map=Map.CARENTAN,
+            game_mode=GameMode.SKIRMISH,
+            time_of_day=TimeOfDay.DAY,
+            weather=Weather.CLEAR,
+            grid=Grid.small(offset=(1000.0, 0.0)),
+            sectors=layout,
+        )
+        assert sector.find_capture_zone((0, 0)) is None
+        assert sector.find_capture_zone((1000, 0)) is not None
+
+    def test_sector_find_capture_zones(self) -> None:
+        sector = Layer.CARENTAN_WARFARE.sectors[2]
+        positions = [
+            (1021.0, 3900.0, 104.0),
+            (0.0, 99999.0, 0.0),
+            (5892.5938, -39387.965, 279.95312),
+        ]
+
+        assert sector.find_capture_zones(positions) == [
+            sector.capture_zones[1],
+            None,
+            sector.capture_zones[0],
+        ]
+        assert sector.find_capture_zones([]) == []
+
+    def test_sector_find_capture_zone_after_copy(self) -> None:
+        sector = Layer.CARENTAN_WARFARE.sectors[2]
+        town_center = sector.capture_zones[1]
+        assert sector.find_capture_zone(town_center.strongpoint.center) is town_center
+
+        copy = sector.model_copy(update={"capture_zones": [sector.capture_zones[0]]})
+        assert copy.find_capture_zone(town_center.strongpoint.center) is None
+        assert sector.find_capture_zone(town_center.strongpoint.center) is town_center
+
+    def test_sector_find_capture_zone_after_shared_offset(self) -> None:
+        large = Sector.large_layout_from_flat(
+            Orientation.HORIZONTAL,
+            [
+                Strongpoint(
+                    id=f"SP{i}{j}",
+                    name=f"Strongpoint {i}{j}",
+                    center=((2 * i - 4) * 20000.0, (2 * j - 2) * 20000.0, 0.0),
+                    radius=5000.0,
+                )
+                for i in range(5)
+                for j in range(3)
+            ],
+        )
+        conquest = sectors.convert_large_layout_to_conquest(large)
+        zone = large[1].capture_zones[1]
+
+        Layer(
+            id="test_layer",
+            map=Map.CARENTAN,
+            game_mode=GameMode.WARFARE,
+            time_of_day=TimeOfDay.DAY,
+            weather=Weather.CLEAR,
+            grid=Grid.large(),
+            sectors=large,
+        )
+        assert large[1].find_capture_zone(zone.strongpoint.center) is zone
+
+        # The conquest layout shares the strongpoint through another Sector object
+        Layer(
+            id="test_layer_conquest",
+            map=Map.CARENTAN,
+            game_mode=GameMode.CONQUEST,
+            time_of_day=TimeOfDay.DAY,
+            weather=Weather.CLEAR,
+            grid=Grid.large(offset=(30000.0, 0.0)),
+            sectors=conquest,
+        )
+        center = zone.strongpoint.center
+        assert center == (-10000.0, 0.0, 0.0)
+        assert zone.contains(center)
+        assert large[1].find_capture_zone(center) is zone
+        assert large[1].find_capture_zone((-40000.0, 0.0, 0.0)) is None
+
+    def test_sector_find_capture_zone_2d(self) -> None:
+        sector = Layer.CARENTAN_WARFARE.sectors[2]
+        town_center = sector.capture_zones[1]
+
+        # Outside of the sphere, but right above its center
+        assert sector.find_capture_zone((1021.0, -1021.0, 9000.0)) is None
+        assert sector.find_capture_zone((1021.0, -1021.0)) is town_center
+        assert sector.find_capture_zone((1021.0, 4100.0)) is None
+        assert sector.find_capture_zones(
+            [(1021.0, -1021.0), (1021.0, 3900.0, 104.0)],
+        ) == [
+            town_center,
+            town_center,
+        ]
+
+    def test_layer_find_capture_zone(self) -> None:
+        layer = Layer.CARENTAN_WARFARE
+        town_center = layer.sectors[2].capture_zones[1]
+        blactot = layer.sectors[0].capture_zones[0]
+
+        assert layer.find_capture_zone((1021.0, 3900.0, 104.0)) is town_center
+        assert layer.find_capture_zone((-65543.41, -39731.965)) is blactot
+        assert layer.find_capture_zone((0.0, 99999.0, 0.0)) is None
+
+    def test_layer_find_capture_zone_after_copy(self) -> None:
+        layer = Layer.CARENTAN_WARFARE
+        town_center = layer.sectors[2].capture_zones[1]
+        assert layer.find_capture_zone((1021.0, 3900.0, 104.0)) is town_center
+
+        copy = layer.model_copy(update={"sectors": []})
+        assert copy.find_capture_zone((1021.0, 3900.0, 104.0)) is None
+        assert layer.find_capture_zone((1021.0, 3900.0, 104.0)) is town_center
+
+    def test_layer_find_capture_zone_after_offset(self) -> None:
+        layout = Sector.skirmish_layout(
+            Orientation.HORIZONTAL,
+            Strongpoint(id="FOO", name="Foo", center=(0, 0, 0), radius=100),
+        )
+        capture_zone = layout[1].capture_zones[0]
+        layer = Layer(
+            id="test_layer",
+            map=Map.CARENTAN,
+            game_mode=GameMode.SKIRMISH,
+            time_of_day=TimeOfDay.DAY,
+            weather=Weather.CLEAR,
+            grid=Grid.small(),
+            sectors=layout,
+        )
+        assert layer.find_capture_zone((0, 0)) is capture_zone
+
+        # Attaching the same sectors to another layer moves their strongpoints
+        Layer(
+            id="test_layer_offset",
+            map=Map.CARENTAN,
+            game_mode=GameMode.SKIRMISH,
+            time_of_day=TimeOfDay.DAY,
+            weather=Weather.CLEAR,
+            grid=Grid.small(offset=(1000.0, 0.0)),
+            sectors=layout,
+        )
+        assert layer.find_capture_zone((0, 0)) is None
+        assert layer.find_capture_zone((1000, 0)) is capture_zone
+
+        # The same goes for strongpoints shared through a different Sector object
+        Layer(
+            id="test_layer_shared",
+            map=Map.CARENTAN,
+            game_mode=GameMode.SKIRMISH,
+            time_of_day=TimeOfDay.DAY,
+            weather=Weather.CLEAR,
+            grid=Grid.small(offset=(500.0, 0.0)),
+            sectors=[
+                layout[0],
+                Sector(
+                    grid_from=layout[1].grid_from,
+                    grid_to=layout[1].grid_to,
+                    capture_zones=[capture_zone],
+                ),
+                layout[2],
+            ],
+        )
+        assert layer.find_capture_zone((1000, 0)) is None
+        assert layer.find_capture_zone((1500, 0)) is capture_zone
+        assert layer.sectors[1].find_capture_zone((1500, 0)) is capture_zone
+
+    def test_layer_find_capture_zones(self) -> None:
+        layer = Layer.CARENTAN_WARFARE
+        positions = [
+            (1021.0, 3900.0, 104.0),
+            (-65543.41, -39731.965),
+            (0.0, 99999.0, 0.0),
+        ]
+
+        assert layer.find_capture_zones(positions) == [
+            layer.find_capture_zone(pos) for pos in positions
+        ]
+        assert layer.find_capture_zones([]) == []
+
+    def test_layer_find_capture_zone_matches_sectors(self) -> None:
+        for layer in Layer.all():
+            for sector in layer.sectors:
+                for capture_zone in sector.capture_zones:
+                    cx, cy, cz = capture_zone.strongpoint.center
+                    for dx in (-6000.0, -2500.0, 0.0, 2500.0, 6000.0):
+                        for dy in (-6000.0, -2500.0, 0.0, 2500.0, 6000.0):
+                            pos = (cx + dx, cy + dy, cz)
+                            expected = next(
+                                (
+                                    found
+                                    for s in layer.sectors
+                                    if (found := s.find_capture_zone(pos))
+                                ),
+                                None,
+                            )
+                            assert layer.find_capture_zone(pos) is expected
+
+    def test_conquest_layouts_reuse_large_layouts(self) -> None:
+        layout = sectors.SECTORS_FOY_LARGE
+        conquest = sectors.SECTORS_FOY_CONQUEST
+        assert conquest[0] is layout[0]
+        assert conquest[1] is not layout[1]
+
+    def test_sector_layout_strings_are_interned(self) -> None:
+        small = sectors.SECTORS_HILL400_SMALL[1].capture_zones[0].strongpoint
+        large = next(
+            capture_zone.strongpoint
+            for sector in sectors.SECTORS_HILL400_LARGE
+            for capture_zone in sector.capture_zones
+            if capture_zone.strongpoint.id == small.id
+        )
+        assert small is not large
+        assert small.id is large.id
+        assert small.name is large.name
+
+    def test_all_sector_layouts(self) -> None:
+        for layout in sectors._read_layouts():
+            sector_layout = getattr(sectors, f"SECTORS_{layout}")
+            assert len(sector_layout) in (3, 5)
+            assert sector_layout[len(sector_layout) // 2].capture_zones
+
 
 class TestDataMaps:
     def test_map_by_id(self) -> None:
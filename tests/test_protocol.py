@@ -3,6 +3,8 @@ import base64
 import binascii
 import itertools
 import json
+import logging
+import sys
 from unittest.mock import Mock
 
 import pytest
@@ -164,7 +166,7 @@ def test_read_from_buffer_too_small(
 ) -> None:
     data = magic + b"\x01\x02\x03\x04\x05\x06\x07"
 
-    protocol._buffer = data
+    protocol._buffer = bytearray(data)
     protocol._read_from_buffer()
     assert protocol._buffer == data
 
@@ -174,7 +176,7 @@ def test_read_from_buffer_incomplete_packet(
 ) -> None:
     data = magic + b"\x01\x00\x00\x00\x05\x00\x00\x00Hell"
 
-    protocol._buffer = data
+    protocol._buffer = bytearray(data)
     protocol._read_from_buffer()
     assert protocol._buffer == data
 
@@ -192,7 +194,7 @@ def test_read_from_buffer_exactly_one_packet(
     waiter: asyncio.Future[RconResponse] = asyncio.Future()
     protocol._waiters[1] = waiter
 
-    protocol._buffer = data
+    protocol._buffer = bytearray(data)
     protocol._read_from_buffer()
     assert protocol._buffer == b""
     assert waiter.result()
@@ -209,7 +211,7 @@ def test_read_from_buffer_exactly_one_packet_missing_waiter(
     )
     data = magic + b"\x01\x00\x00\x00\x05\x00\x00\x00Hello"
 
-    protocol._buffer = data
+    protocol._buffer = bytearray(data)
     protocol._read_from_buffer()
     assert protocol._buffer == b""
     mock_unpack.assert_called_once_with(1, b"Hello")
@@ -237,7 +239,7 @@ def test_read_from_buffer_more_than_one_packet(
     protocol._waiters[1] = waiter1
     protocol._waiters[2] = waiter2
 
-    protocol._buffer = data
+    protocol._buffer = bytearray(data)
     protocol._read_from_buffer()
     assert protocol._buffer == magic + b"\x00\x00"
     assert waiter1.result()
@@ -247,6 +249,23 @@ def test_read_from_buffer_more_than_one_packet(
     mock_unpack.assert_called_with(2, b"World")
 
 
+def test_read_from_buffer_many_packets(
+    mocker: MockerFixture,
+    protocol: RconProtocol,
+) -> None:
+    mock_unpack = mocker.patch(
+        "hllrcon.protocol.protocol.RconResponse.unpack",
+        autospec=True,
+    )
+    num_packets = sys.getrecursionlimit() + 10
+    data = (magic + b"\x01\x00\x00\x00\x05\x00\x00\x00Hello") * num_packets
+
+    protocol._buffer = bytearray(data)
+    protocol._read_from_buffer()
+    assert protocol._buffer == b""
+    assert mock_unpack.call_count == num_packets
+
+
 def test_read_from_buffer_magic_value_missing(
     mocker: MockerFixture,
     protocol: RconProtocol,
@@ -254,7 +273,7 @@ def test_read_from_buffer_magic_value_missing(
     mock_logger = mocker.patch.object(protocol.logger, "warning")
     data = b"\x00\x00\x00\x00\x01\x00\x00\x00\x05\x00\x00\x00Hello"
 
-    protocol._buffer = data
+    protocol._buffer = bytearray(data)
     protocol._read_from_buffer()
     assert protocol._buffer == b""
     mock_logger.assert_called_once_with(
@@ -278,7 +297,7 @@ def test_read_from_buffer_magic_value_is_offset(
         + b"\x01\x00\x00\x00\x05\x00\x00\x00Hello"
     )
     waiter: asyncio.Future[RconResponse] = asyncio.Future()
-    protocol._buffer = data
+    protocol._buffer = bytearray(data)
     protocol._waiters[1] = waiter
     protocol._read_from_buffer()
     assert protocol._buffer == b""
@@ -402,42 +421,24 @@ def test_xor_roundtrip(protocol: RconProtocol) -> None:
     assert decrypted == msg
 
 
-def test_xor_length_mismatch_raises(
-    protocol: RconProtocol,
-    mocker: MockerFixture,
-) -> None:
-    protocol.xorkey = b"\x01"
-    msg = b"\x01\x02"
-    # Patch array.array to return wrong length
-    mock_array = mocker.patch("array.array")
-    mock_array.return_value.tobytes.return_value = b"\x00"
-    with pytest.raises(
-        ValueError,
-        match="XOR operation resulted in a different length",
-    ):
-        protocol._xor(msg)
+def test_xor_growing_messages(protocol: RconProtocol) -> None:
+    protocol.xorkey = b"\x01\x02\x03"
+    for size in (2, 5, 4, 100, 7):
+        msg = bytes(range(size))
+        expected = bytes(c ^ protocol.xorkey[i % 3] for i, c in enumerate(msg))
+        assert protocol._xor(msg) == expected
+        assert protocol._xor(msg, offset=4) == bytes(
+            c ^ protocol.xorkey[(i + 4) % 3] for i, c in enumerate(msg)
+        )
 
 
-def test_xor_warns_on_length_mismatch(
-    protocol: RconProtocol,
-    mocker: MockerFixture,
-) -> None:
-    protocol.xorkey = b"\x01"
-    msg = b"\x01\x02"
-    # Patch array.array to return wrong length and check logger.warning called
-    mock_array = mocker.patch("array.array")
-    mock_array.return_value.tobytes.return_value = b"\x00"
-    mock_logger = mocker.patch.object(protocol.logger, "warning")
-    with pytest.raises(
-        ValueError,
-        match="XOR operation resulted in a different length",
-    ):
-        protocol._xor(msg)
-    mock_logger.assert_called_with(
-        "XOR operation resulted in a different length: %s != %s",
-        1,
-        2,
-    )
+def test_xor_key_change(protocol: RconProtocol) -> None:
+    msg = b"\x00\x00\x00\x00"
+    protocol.xorkey = b"\x01\x02"
+    assert protocol._xor(msg) == b"\x01\x02\x01\x02"
+
+    protocol.xorkey = b"\x03"
+    assert protocol._xor(msg) == b"\x03\x03\x03\x03"
 
 
 @pytest.mark.asyncio
@@ -481,6 +482,57 @@ async def test_execute(
     transport.write.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_execute_with_debug_logging(
+    protocol: RconProtocol,
+    transport: Mock,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    caplog.set_level(logging.DEBUG, logger=protocol.logger.name)
+    asyncio.get_event_loop().call_later(
+        0.1,
+        protocol.data_received,
+        make_response(0, "response"),
+    )
+    response = await protocol.execute("command", 1, "body")
+    assert response.content_body == "response"
+    transport.write.assert_called_once()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(message.startswith("Writing: ") for message in messages)
+    assert any(message.startswith("Incoming: ") for message in messages)
+
+
+@pytest.mark.asyncio
+async def test_execute_without_debug_logging(
+    protocol: RconProtocol,
+    transport: Mock,
+    caplog: pytest.LogCaptureFixture,
+    mocker: MockerFixture,
+) -> None:
+    caplog.set_level(logging.INFO, logger=protocol.logger.name)
+    xor = mocker.patch.object(
+        RconProtocol,
+        "_xor",
+        autospec=True,
+        side_effect=RconProtocol._xor,
+    )
+    debug = mocker.spy(protocol.logger, "debug")
+    data = make_response(0, "response")
+    asyncio.get_event_loop().call_later(0.1, protocol.data_received, data)
+    response = await protocol.execute("command", 1, "body")
+    assert response.content_body == "response"
+    transport.write.assert_called_once()
+
+    # Only the request and response bodies are decoded, not the incoming data
+    assert xor.call_count == 2
+    assert all(call.args[1] != data for call in xor.call_args_list)
+    assert not any(
+        call.args[0].startswith(("Writing: ", "Incoming: "))
+        for call in debug.call_args_list
+    )
+
+
 @pytest.mark.asyncio
 async def test_execute_with_timeout(
     protocol: RconProtocol,